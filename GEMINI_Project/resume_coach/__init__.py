@@ -0,0 +1 @@
+"""Resume coach helpers and the CatBot Gemini client."""
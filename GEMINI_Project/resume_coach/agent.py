@@ -4,82 +4,114 @@ Provides parsing, matching and suggestion helpers for tailoring a resume
 to a job description. These functions are deterministic and don't require
 an LLM; the CLI can optionally invoke an LLM to produce richer rewrites.
 """
-from typing import List, Dict, Tuple
+from typing import Final, List, Dict, Optional, Set, Tuple
 import re
+import sys
 
-VERB_KEYWORDS = [
+VERB_KEYWORDS: Final[Tuple[str, ...]] = (
     "managed", "led", "developed", "designed", "implemented", "built", "created",
     "improved", "optimized", "automated", "reduced", "increased", "delivered",
-]
+)
+
+# Resume section headers; `lastgroup` names the section a line opens.
+_HDR = re.compile(
+    r'^(?P<skills>skills|technical skills|skillset)(?:[:\- ]|$)'
+    r'|^(?P<experience>experience|work experience|professional experience)(?:[:\- ]|$)'
+    r'|^(?P<summary>summary|profile|professional summary)(?:[:\- ]|$)',
+    re.IGNORECASE,
+)
+# JD section markers; skills keywords take precedence when a line mentions both.
+_JD_HDR = re.compile(
+    r'^(?=.*?(?P<skills>skills|requirements|technologies))'
+    r'|^(?=.*?(?P<responsibilities>responsibil|what you will))',
+    re.IGNORECASE,
+)
+# Whole-word match so e.g. "led" does not fire inside "handled" or "skilled".
+_VERBS = re.compile(r'\b(?:' + '|'.join(map(re.escape, VERB_KEYWORDS)) + r')\b', re.IGNORECASE)
+_BULLETS = frozenset(('-', '•', '*'))
+_SPLIT = re.compile(r'[;,|]')
+_DEFAULT_Q = {'question': 'Describe a technical challenge you solved recently.', 'tip': 'Explain trade-offs, your approach, and measurable outcome.'}
+# Any digit means the bullet already carries a metric.
+_HAS_NUM = re.compile(r'\d')
 
 
 def _lines(text: str) -> List[str]:
     return [l.strip() for l in (text or '').splitlines() if l.strip()]
 
 
+def _add_skills(parts: List[str], skills: List[str], seen: Set[str]) -> None:
+    # Keep the first spelling of each skill; `seen` holds the lowercased forms.
+    # Both are interned so repeated skills across documents share one object.
+    for p in parts:
+        val = p.strip()
+        if not val:
+            continue
+        val_lc = sys.intern(val.lower())
+        if val_lc in seen:
+            continue
+        seen.add(val_lc)
+        skills.append(sys.intern(val))
+
+
+def _skills_lc(parsed: Dict) -> frozenset:
+    # Parsers precompute lowercased skills; fall back for hand-built dicts.
+    lc = parsed.get('skills_lc')
+    if lc is None:
+        lc = frozenset(s.lower() for s in parsed.get('skills', []))
+    return lc
+
+
 def parse_resume(text: str) -> Dict:
     lines = _lines(text)
-    summary_lines = []
-    skills = []
-    experience = []
+    summary_lines: List[str] = []
+    skills: List[str] = []
+    seen: Set[str] = set()
+    experience: List[str] = []
 
-    section = None
+    section: Optional[str] = None
     for line in lines:
-        llow = line.lower()
-        if re.match(r'^(skills|technical skills|skillset)[:\- ]', llow) or llow == 'skills':
-            section = 'skills'
-            continue
-        if re.match(r'^(experience|work experience|professional experience)[:\- ]', llow) or llow == 'experience':
-            section = 'experience'
-            continue
-        if re.match(r'^(summary|profile|professional summary)[:\- ]', llow) or llow == 'summary':
-            section = 'summary'
+        m = _HDR.match(line)
+        if m:
+            section = m.lastgroup
             continue
 
         if section == 'skills':
-            parts = re.split(r'[;,|]', line)
-            for p in parts:
-                val = p.strip()
-                if val:
-                    skills.append(val)
+            _add_skills(_SPLIT.split(line), skills, seen)
             continue
 
         if section == 'experience':
             experience.append(line)
             continue
 
-        if line.startswith(('-', '•', '*')) or any(v in llow for v in VERB_KEYWORDS):
+        if line[:1] in _BULLETS:
             experience.append(line.lstrip('-•* ').strip())
             continue
+        if _VERBS.search(line):
+            experience.append(line)
+            continue
 
         if len(summary_lines) < 3 and len(line.split()) < 40:
             summary_lines.append(line)
 
     summary = ' '.join(summary_lines).strip()
-    return {'summary': summary, 'skills': skills, 'experience': experience}
+    return {'summary': summary, 'skills': skills, 'skills_lc': frozenset(seen), 'experience': experience}
 
 
 def parse_jd(text: str) -> Dict:
     lines = _lines(text)
     title = lines[0] if lines else ''
-    skills = []
-    responsibilities = []
-    section = None
+    skills: List[str] = []
+    seen: Set[str] = set()
+    responsibilities: List[str] = []
+    section: Optional[str] = None
     for line in lines[1:]:
-        llow = line.lower()
-        if 'skills' in llow or 'requirements' in llow or 'technologies' in llow:
-            section = 'skills'
-            continue
-        if 'responsibil' in llow or 'what you will' in llow:
-            section = 'responsibilities'
+        m = _JD_HDR.match(line)
+        if m:
+            section = m.lastgroup
             continue
 
         if section == 'skills':
-            parts = re.split(r'[;,|]', line)
-            for p in parts:
-                val = p.strip()
-                if val:
-                    skills.append(val)
+            _add_skills(_SPLIT.split(line), skills, seen)
             continue
 
         if section == 'responsibilities':
@@ -89,18 +121,22 @@ def parse_jd(text: str) -> Dict:
         if ',' in line and len(line) < 120:
             parts = [p.strip() for p in line.split(',') if p.strip()]
             if len(parts) > 1:
-                skills.extend(parts)
+                _add_skills(parts, skills, seen)
 
-    return {'title': title, 'skills': skills, 'responsibilities': responsibilities}
+    return {'title': title, 'skills': skills, 'skills_lc': frozenset(seen), 'responsibilities': responsibilities}
 
 
 def match_and_score(resume: Dict, jd: Dict) -> Tuple[float, List[str]]:
-    resume_skills = {s.lower() for s in resume.get('skills', [])}
-    jd_skills = {s.lower() for s in jd.get('skills', [])}
+    resume_skills = _skills_lc(resume)
+    jd_skills = _skills_lc(jd)
     if not jd_skills:
         return 0.0, []
+    if resume_skills.isdisjoint(jd_skills):
+        return 0.0, sorted(jd_skills)
+    if jd_skills <= resume_skills:
+        return 100.0, []
     matched = resume_skills.intersection(jd_skills)
-    missing = sorted(list(jd_skills - resume_skills))
+    missing = sorted(jd_skills - resume_skills)
     score = 100.0 * len(matched) / len(jd_skills)
     return round(score, 1), missing
 
@@ -114,10 +150,9 @@ def suggest_resume_updates(resume: Dict, jd: Dict, max_suggestions: int = 6) ->
     _, missing = match_and_score(resume, jd)
     add_skills = missing[:10]
 
-    rewritten = []
+    rewritten: List[str] = []
     for b in resume.get('experience', [])[:max_suggestions]:
-        nums = re.findall(r"\d+[\.,]?\d*%?|\d+", b)
-        if nums:
+        if _HAS_NUM.search(b):
             rewritten.append(b if len(b) < 240 else b[:240] + '...')
             continue
         rewritten.append(b + ' (include quantifiable impact, e.g., reduced X by Y% or improved throughput by N)')
@@ -128,7 +163,7 @@ def suggest_resume_updates(resume: Dict, jd: Dict, max_suggestions: int = 6) ->
 def generate_coaching_questions(jd: Dict, n: int = 8) -> List[Dict]:
     skills = jd.get('skills', [])
     responsibilities = jd.get('responsibilities', [])
-    questions = []
+    questions: List[Dict] = []
 
     for s in (skills[:n] if skills else []):
         q = f"Can you describe your experience with {s}?"
@@ -140,15 +175,14 @@ def generate_coaching_questions(jd: Dict, n: int = 8) -> List[Dict]:
         tip = "Use STAR (Situation, Task, Action, Result) and quantify results when possible."
         questions.append({'question': q, 'tip': tip})
 
-    while len(questions) < n:
-        questions.append({'question': 'Describe a technical challenge you solved recently.', 'tip': 'Explain trade-offs, your approach, and measurable outcome.'})
+    questions.extend(dict(_DEFAULT_Q) for _ in range(n - len(questions)))
 
     return questions
 
 
 def tailor_resume_text(original_text: str, suggestions: Dict) -> str:
     lines = _lines(original_text)
-    out = []
+    out: List[str] = []
     if suggestions.get('suggested_summary'):
         out.append(suggestions['suggested_summary'])
         out.append('')
@@ -158,20 +192,27 @@ def tailor_resume_text(original_text: str, suggestions: Dict) -> str:
         out.append(', '.join(suggestions['add_skills']))
         out.append('')
 
+    rewritten = suggestions.get('rewritten_experience', [])
+    max_replace = len(rewritten)
     replaced = 0
-    max_replace = len(suggestions.get('rewritten_experience', []))
-    for line in lines:
-        if replaced < max_replace and (line.startswith('-') or any(v in line.lower() for v in VERB_KEYWORDS)):
-            out.append('- ' + suggestions['rewritten_experience'][replaced])
+    i = 0
+    out_append = out.append
+    # Replace bullets until the quota is filled, then copy the rest unscanned.
+    while replaced < max_replace and i < len(lines):
+        line = lines[i]
+        i += 1
+        if line.startswith('-') or _VERBS.search(line):
+            out_append('- ' + rewritten[replaced])
             replaced += 1
-            continue
-        out.append(line)
+        else:
+            out_append(line)
+    out.extend(lines[i:])
 
     if replaced < max_replace:
         out.append('')
         out.append('Experience (suggested improvements):')
         for i in range(replaced, max_replace):
-            out.append('- ' + suggestions['rewritten_experience'][i])
+            out.append('- ' + rewritten[i])
 
     return '\n'.join(out)
 
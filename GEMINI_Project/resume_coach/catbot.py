@@ -5,25 +5,37 @@ then calls the `call_gemini_flash` wrapper to get coaching guidance, interview
 questions, and feedback on sample answers. This module keeps prompts explicit
 so the behavior is easy to iterate on.
 """
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
+import asyncio
+import functools
 import os
-from .llm import call_gemini_flash
+from .llm import call_gemini_flash, call_gemini_flash_async, call_gemini_flash_stream
+
+try:
+    import aiohttp
+except ImportError:  # only needed for coach_candidates_batch
+    aiohttp = None
 
 DEFAULT_MODEL = 'gemini-2.5-flash'
 
 
+@functools.lru_cache(maxsize=64)
 def _build_coaching_prompt(jd_text: str, resume_text: str, n_questions: int = 6) -> str:
-    return (
+    return ''.join([
         "You are CatBot, an expert interview coach. Provide concise, actionable coaching "
         "for the candidate given the Job Description and Resume below.\n\n"
-        "Instructions:\n"
-        "- Produce an ordered list of the top {n} likely interview questions tailored to the JD.\n"
+        "Instructions:\n",
+        f"- Produce an ordered list of the top {n_questions} likely interview questions tailored to the JD.\n",
         "- For each question, provide a 2-3 sentence model answer structure (STAR format) and a 1-2 sentence coaching tip.\n"
         "- Provide a short (3-5) point checklist of resume improvements specific to the JD (what to emphasize, which metrics to add).\n"
         "- Keep responses plain text and clearly labeled (Question, Model Answer, Tip, Resume Checklist).\n"
         "- Do NOT invent credentials, dates, or companies. If information is missing, suggest how the candidate could phrase hypothetical improvements using terms like 'If applicable, mention...'.\n\n"
-        "JOB DESCRIPTION:\n" + jd_text + "\n\nRESUME:\n" + resume_text + "\n\n"
-    ).replace('{n}', str(n_questions))
+        "JOB DESCRIPTION:\n",
+        jd_text,
+        "\n\nRESUME:\n",
+        resume_text,
+        "\n\n",
+    ])
 
 
 def coach_candidate(jd_text: str, resume_text: str, n_questions: int = 6, api_key: Optional[str] = None, model: str = DEFAULT_MODEL) -> str:
@@ -40,5 +52,45 @@ def coach_candidate(jd_text: str, resume_text: str, n_questions: int = 6, api_ke
     return call_gemini_flash(prompt=prompt, api_key=api_key, model=model, max_output_tokens=1024, temperature=0.15)
 
 
+def coach_candidate_stream(jd_text: str, resume_text: str, n_questions: int = 6, api_key: Optional[str] = None, model: str = DEFAULT_MODEL) -> Iterator[str]:
+    """Like `coach_candidate`, but yield the coaching text in chunks as it streams in."""
+    api_key = api_key or os.environ.get('GOOGLE_API_KEY')
+    if not api_key:
+        raise RuntimeError('GOOGLE_API_KEY required for CatBot to call Gemini Flash')
+
+    prompt = _build_coaching_prompt(jd_text, resume_text, n_questions=n_questions)
+    return call_gemini_flash_stream(prompt=prompt, api_key=api_key, model=model, max_output_tokens=1024, temperature=0.15)
+
+
+async def _coach_one(session: 'aiohttp.ClientSession', sem: asyncio.Semaphore, jd_text: str, resume_text: str, n_questions: int, api_key: str, model: str) -> str:
+    prompt = _build_coaching_prompt(jd_text, resume_text, n_questions=n_questions)
+    async with sem:
+        return await call_gemini_flash_async(session, prompt=prompt, api_key=api_key, model=model, max_output_tokens=1024, temperature=0.15)
+
+
+async def _coach_batch(pairs: List[Tuple[str, str]], n_questions: int, api_key: str, model: str, concurrency: int) -> List[str]:
+    sem = asyncio.Semaphore(concurrency)
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
+        return await asyncio.gather(*(
+            _coach_one(session, sem, jd_text, resume_text, n_questions, api_key, model)
+            for jd_text, resume_text in pairs
+        ))
+
+
+def coach_candidates_batch(pairs: Iterable[Tuple[str, str]], n_questions: int = 6, api_key: Optional[str] = None, model: str = DEFAULT_MODEL, concurrency: int = 8) -> List[str]:
+    """Coach several candidates concurrently; `pairs` holds (jd_text, resume_text).
+
+    Returns the coaching texts in input order. At most `concurrency` requests
+    are in flight at once. Requires the optional `aiohttp` package.
+    """
+    api_key = api_key or os.environ.get('GOOGLE_API_KEY')
+    if not api_key:
+        raise RuntimeError('GOOGLE_API_KEY required for CatBot to call Gemini Flash')
+    if aiohttp is None:
+        raise RuntimeError('aiohttp is required for batch coaching (pip install aiohttp)')
+
+    return asyncio.run(_coach_batch(list(pairs), n_questions, api_key, model, concurrency))
+
+
 if __name__ == '__main__':
     print('CatBot is a module; call coach_candidate(jd_text, resume_text).')
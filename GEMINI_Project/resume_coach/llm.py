@@ -8,36 +8,113 @@ account auth, we can add that later.
 """
 import os
 import json
+import logging
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from typing import TYPE_CHECKING, Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
+if TYPE_CHECKING:
+    import aiohttp
+
+logger = logging.getLogger(__name__)
 
 DEFAULT_MODEL = 'gemini-2.5-flash'
+# The sync/async calls and the streaming call target different API versions on
+# purpose: v1beta2 `:generate` takes a `prompt` body and has no streaming
+# method, while streaming uses v1beta `:streamGenerateContent?alt=sse`, which
+# takes a `contents`/`generationConfig` body. Moving one call to the other's
+# version also means changing its request body and response parsing.
 DEFAULT_ENDPOINT = 'https://generativelanguage.googleapis.com/v1beta2/models/{model}:generate'
+# Server-Sent-Events endpoint (v1beta) used by call_gemini_flash_stream.
+DEFAULT_STREAM_ENDPOINT = 'https://generativelanguage.googleapis.com/v1beta/models/{model}:streamGenerateContent'
+
+# Shared session so repeated calls reuse pooled keep-alive connections
+# instead of paying a fresh TCP+TLS handshake each time.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_maxsize=16))
+
+# Cap on how much of an unrecognised response is returned as text.
+_MAX_FALLBACK_BYTES = 4096
+
+_HEADERS = {'Content-Type': 'application/json', 'Connection': 'keep-alive'}
+
+
+def _request_url(model: str, api_key: str) -> str:
+    return DEFAULT_ENDPOINT.format(model=model) + f'?key={api_key}'
+
+
+def _request_body(prompt: str, max_output_tokens: int, temperature: float) -> dict:
+    return {
+        'prompt': {'text': prompt},
+        'temperature': temperature,
+        'maxOutputTokens': max_output_tokens,
+    }
+
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Response fields that may hold the model text, tried in order. The exact
+# field name can change between API versions (v1beta2 'candidates' style
+# first, then v1 top-level 'output').
+_TEXT_PATHS = (
+    ('candidates', 0, 'content'),
+    ('candidates', 0, 'content', 'parts', 0, 'text'),
+    ('candidates', 0, 'output'),
+    ('candidates', 0, 'text'),
+    ('candidates', 0, 'message', 'content'),
+    ('candidates', 0, 'message', 'text'),
+    ('output',),
+)
+
+
+def _dig(obj, path):
+    for k in path:
+        obj = obj[k]
+    return obj
+
+
+def _find_text(resp_json: dict) -> Optional[str]:
+    # Prefer the first non-empty string (so an empty message 'content' falls
+    # through to 'text'), but still report an empty completion as ''.
+    found = None
+    for path in _TEXT_PATHS:
+        try:
+            val = _dig(resp_json, path)
+        except (KeyError, IndexError, TypeError):
+            continue
+        if isinstance(val, str):
+            if val:
+                return val
+            found = val
+    return found
 
 
 def _extract_text_from_response(resp_json: dict) -> str:
-    # Try common keys used by Generative API responses.
-    # The exact field name can change; this helper attempts a few fallbacks.
     if not isinstance(resp_json, dict):
         return ''
-    # v1beta2 style: 'candidates' -> list of dicts with 'output' or 'content'
-    if 'candidates' in resp_json and isinstance(resp_json['candidates'], list) and resp_json['candidates']:
-        cand = resp_json['candidates'][0]
-        for k in ('content', 'output', 'text'):
-            if k in cand:
-                return cand[k]
-        # sometimes candidate has 'message' with 'content'
-        if 'message' in cand and isinstance(cand['message'], dict):
-            cont = cand['message'].get('content') or cand['message'].get('text')
-            if isinstance(cont, str):
-                return cont
-
-    # v1 style: 'output' top-level
-    if 'output' in resp_json and isinstance(resp_json['output'], str):
-        return resp_json['output']
-
-    # fallback: try to stringify the response
-    return json.dumps(resp_json)
+    text = _find_text(resp_json)
+    if text is not None:
+        return text
+
+    # fallback: return a bounded stringified response; error payloads can be large
+    raw = _dumps(resp_json)
+    logger.debug('Unrecognised Gemini response: %s', raw)
+    return raw[:_MAX_FALLBACK_BYTES].decode('utf-8', errors='ignore')
 
 
 def call_gemini_flash(prompt: str, api_key: Optional[str] = None, model: str = DEFAULT_MODEL, max_output_tokens: int = 1024, temperature: float = 0.2) -> str:
@@ -50,18 +127,10 @@ def call_gemini_flash(prompt: str, api_key: Optional[str] = None, model: str = D
     if not api_key:
         raise RuntimeError('GOOGLE_API_KEY not provided')
 
-    endpoint = DEFAULT_ENDPOINT.format(model=model)
-    url = endpoint + f'?key={api_key}'
-
-    body = {
-        'prompt': {'text': prompt},
-        'temperature': temperature,
-        'maxOutputTokens': max_output_tokens,
-    }
-
-    headers = {'Content-Type': 'application/json'}
+    url = _request_url(model, api_key)
+    body = _request_body(prompt, max_output_tokens, temperature)
     try:
-        r = requests.post(url, headers=headers, json=body, timeout=30)
+        r = _SESSION.post(url, headers=_HEADERS, data=_dumps(body), timeout=30)
     except Exception as e:
         return f'LLM request failed: {e}'
 
@@ -69,12 +138,79 @@ def call_gemini_flash(prompt: str, api_key: Optional[str] = None, model: str = D
         return f'LLM request failed: {r.status_code} {r.text}'
 
     try:
-        resp_json = r.json()
+        resp_json = _loads(r.content)
     except Exception:
         return r.text
 
     return _extract_text_from_response(resp_json)
 
 
+async def call_gemini_flash_async(session: 'aiohttp.ClientSession', prompt: str, api_key: str, model: str = DEFAULT_MODEL, max_output_tokens: int = 1024, temperature: float = 0.2) -> str:
+    """Async variant of `call_gemini_flash` that posts through an aiohttp session.
+
+    The caller owns `session` (and its timeout) so many calls can share one
+    connection pool. Errors are returned as messages, as in the sync call.
+    """
+    url = _request_url(model, api_key)
+    body = _request_body(prompt, max_output_tokens, temperature)
+    try:
+        async with session.post(url, headers=_HEADERS, data=_dumps(body)) as r:
+            if r.status != 200:
+                return f'LLM request failed: {r.status} {await r.text()}'
+            raw = await r.read()
+    except Exception as e:
+        return f'LLM request failed: {e}'
+
+    try:
+        resp_json = _loads(raw)
+    except Exception:
+        return raw.decode('utf-8', errors='replace')
+
+    return _extract_text_from_response(resp_json)
+
+
+def call_gemini_flash_stream(prompt: str, api_key: Optional[str] = None, model: str = DEFAULT_MODEL, max_output_tokens: int = 1024, temperature: float = 0.2) -> Iterator[str]:
+    """Stream Gemini Flash output, yielding text chunks as they arrive.
+
+    Uses the Server-Sent-Events variant of the API so callers can show
+    output before the full response is ready. Failures are yielded as a
+    single error message, like `call_gemini_flash` returns them.
+    Because this is a generator, a missing API key raises `RuntimeError`
+    on the first `next()`, not when the function is called.
+    """
+    api_key = api_key or os.environ.get('GOOGLE_API_KEY')
+    if not api_key:
+        raise RuntimeError('GOOGLE_API_KEY not provided')
+
+    url = DEFAULT_STREAM_ENDPOINT.format(model=model) + f'?alt=sse&key={api_key}'
+    body = {
+        'contents': [{'parts': [{'text': prompt}]}],
+        'generationConfig': {'temperature': temperature, 'maxOutputTokens': max_output_tokens},
+    }
+    try:
+        r = _SESSION.post(url, headers=_HEADERS, data=_dumps(body), stream=True, timeout=30)
+    except Exception as e:
+        yield f'LLM request failed: {e}'
+        return
+
+    with r:
+        if r.status_code != 200:
+            yield f'LLM request failed: {r.status_code} {r.text}'
+            return
+        try:
+            for line in r.iter_lines():
+                if not line.startswith(b'data:'):
+                    continue
+                try:
+                    event = _loads(line[5:])
+                except Exception:
+                    continue
+                text = _find_text(event) if isinstance(event, dict) else None
+                if text:
+                    yield text
+        except Exception as e:
+            yield f'LLM request failed: {e}'
+
+
 if __name__ == '__main__':
     print('This module calls Gemini Flash when GOOGLE_API_KEY is set.')
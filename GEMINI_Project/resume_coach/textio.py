@@ -0,0 +1,43 @@
+"""Input helpers shared by the CLI scripts.
+
+Resume and JD arguments may be either a file path or the text itself;
+`load_text` resolves both to a string.
+"""
+import os
+from pathlib import Path
+
+_CHUNK = 65536
+
+
+def _read_fd(fd: int) -> bytes:
+    # Regular files are small, so one read sized from fstat usually returns
+    # everything. FIFOs, /dev/stdin and procfs files report st_size 0 (or a
+    # wrong size), and reads can come back short, so finish with a loop to EOF.
+    size = os.fstat(fd).st_size
+    data = os.read(fd, size) if size else b''
+    if size and len(data) == size:
+        return data
+    chunks = [data]
+    while True:
+        chunk = os.read(fd, _CHUNK)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return b''.join(chunks)
+
+
+def load_text(path_or_text: str) -> str:
+    p = Path(path_or_text)
+    try:
+        is_file = p.exists()
+    except OSError:
+        # Inline text longer than the OS name limit (ENAMETOOLONG) is not a path.
+        return path_or_text
+    if is_file:
+        fd = os.open(str(p), os.O_RDONLY)
+        try:
+            data = _read_fd(fd)
+        finally:
+            os.close(fd)
+        return data.decode('utf-8')
+    return path_or_text
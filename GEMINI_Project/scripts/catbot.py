@@ -2,40 +2,72 @@
 """CLI wrapper to run CatBot coaching via Gemini Flash (API key required)."""
 import argparse
 import json
+import sys
 from pathlib import Path
 import os
 
-from src.resume_coach.catbot import coach_candidate
+from src.resume_coach.catbot import coach_candidate, coach_candidate_stream, coach_candidates_batch
+from src.resume_coach.textio import load_text
 
 
-def load_text(path_or_text: str) -> str:
-    p = Path(path_or_text)
-    if p.exists():
-        return p.read_text(encoding='utf-8')
-    return path_or_text
+def run_batch(args, api_key: str) -> None:
+    pairs = []
+    with open(args.batch, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                item = json.loads(line)
+                pairs.append((load_text(item['jd']), load_text(item['resume'])))
+
+    outputs = coach_candidates_batch(pairs, n_questions=args.questions, api_key=api_key)
+
+    out_path = Path(args.out)
+    paths = []
+    for i, output_text in enumerate(outputs, 1):
+        path = out_path.with_name(f'{out_path.stem}_{i}{out_path.suffix}')
+        path.write_text(output_text, encoding='utf-8')
+        paths.append(str(path.resolve()))
+    print(json.dumps({'coaching_paths': paths}, ensure_ascii=False))
 
 
 def main():
     p = argparse.ArgumentParser(description='CatBot - coaching assistant using Gemini Flash')
-    p.add_argument('--resume', '-r', required=True, help='Path to resume text file or paste resume text')
-    p.add_argument('--jd', '-j', required=True, help='Path to job description text file or paste JD text')
+    p.add_argument('--resume', '-r', help='Path to resume text file or paste resume text')
+    p.add_argument('--jd', '-j', help='Path to job description text file or paste JD text')
+    p.add_argument('--batch', '-b', help='Path to a JSONL file of {"resume": ..., "jd": ...} pairs to coach concurrently')
     p.add_argument('--questions', '-n', type=int, default=6, help='Number of tailored questions to generate')
     p.add_argument('--out', '-o', help='Output file for coaching text (defaults to catbot_coaching.txt)', default='catbot_coaching.txt')
+    p.add_argument('--stream', action='store_true', help='Print coaching text as it arrives (also written to --out)')
     p.add_argument('--api-key', help='Optional: provide GOOGLE_API_KEY here; otherwise the environment is used')
     args = p.parse_args()
-
-    resume_text = load_text(args.resume)
-    jd_text = load_text(args.jd)
+    if not args.batch and not (args.resume and args.jd):
+        p.error('--resume and --jd are required unless --batch is given')
+    if args.batch and args.stream:
+        p.error('--stream cannot be combined with --batch')
 
     api_key = args.api_key or os.environ.get('GOOGLE_API_KEY')
     if not api_key:
         print('ERROR: GOOGLE_API_KEY must be set in the environment or provided with --api-key')
         raise SystemExit(1)
 
-    output_text = coach_candidate(jd_text=jd_text, resume_text=resume_text, n_questions=args.questions, api_key=api_key)
+    if args.batch:
+        run_batch(args, api_key)
+        return
+
+    resume_text = load_text(args.resume)
+    jd_text = load_text(args.jd)
 
-    Path(args.out).write_text(output_text, encoding='utf-8')
-    print(json.dumps({'coaching_path': str(Path(args.out).resolve())}, ensure_ascii=False))
+    out_path = Path(args.out)
+    if args.stream:
+        with out_path.open('w', encoding='utf-8') as f:
+            for chunk in coach_candidate_stream(jd_text=jd_text, resume_text=resume_text, n_questions=args.questions, api_key=api_key):
+                sys.stdout.write(chunk)
+                sys.stdout.flush()
+                f.write(chunk)
+        sys.stdout.write('\n')
+    else:
+        output_text = coach_candidate(jd_text=jd_text, resume_text=resume_text, n_questions=args.questions, api_key=api_key)
+        out_path.write_text(output_text, encoding='utf-8')
+    print(json.dumps({'coaching_path': str(out_path.resolve())}, ensure_ascii=False))
 
 
 if __name__ == '__main__':
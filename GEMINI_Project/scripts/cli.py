@@ -2,18 +2,31 @@
 """Simple CLI for the Resume Coach Agent."""
 import argparse
 import json
+import sys
 from pathlib import Path
 
 from src.resume_coach.agent import parse_resume, parse_jd, suggest_resume_updates, match_and_score, generate_coaching_questions, tailor_resume_text
 from src.resume_coach.llm import call_gemini_flash
+from src.resume_coach.textio import load_text
 import os
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
 
-def load_text(path_or_text: str) -> str:
-    p = Path(path_or_text)
-    if p.exists():
-        return p.read_text(encoding='utf-8')
-    return path_or_text
+
+def build_tailoring_prompt(jd_text: str, resume_text: str) -> str:
+    return ''.join([
+        "Tailor the resume below to the job description. Produce a concise, professional, and ATS-friendly resume "
+        "that highlights relevant skills and quantifiable achievements. Keep formatting as plain text.\n\n"
+        "JOB DESCRIPTION:\n",
+        jd_text,
+        "\n\nRESUME:\n",
+        resume_text,
+        "\n\n"
+        "Make changes only to wording (do not invent credentials). If information is missing, add suggested skill lines prefixed with 'Suggested Skill:'.\n",
+    ])
 
 
 def main():
@@ -36,12 +49,7 @@ def main():
     # If GOOGLE_API_KEY is present, call Gemini Flash 2.5 to produce a tailored resume.
     tailored = None
     if os.environ.get('GOOGLE_API_KEY'):
-        prompt = (
-            "Tailor the resume below to the job description. Produce a concise, professional, and ATS-friendly resume "
-            "that highlights relevant skills and quantifiable achievements. Keep formatting as plain text.\n\n"
-            "JOB DESCRIPTION:\n" + jd_text + "\n\nRESUME:\n" + resume_text + "\n\n" 
-            "Make changes only to wording (do not invent credentials). If information is missing, add suggested skill lines prefixed with 'Suggested Skill:'.\n"
-        )
+        prompt = build_tailoring_prompt(jd_text, resume_text)
         llm_out = call_gemini_flash(prompt)
         # If LLM returned an error-like string, fall back to heuristic tailoring
         if llm_out and not llm_out.startswith('LLM request failed') and 'failed' not in llm_out.lower():
@@ -50,17 +58,24 @@ def main():
     if not tailored:
         tailored = tailor_resume_text(resume_text, suggestions)
 
-    Path(args.out).write_text(tailored, encoding='utf-8')
+    out_path = Path(args.out)
+    out_path.write_text(tailored, encoding='utf-8')
 
     output = {
         'match_score': score,
         'missing_skills': missing,
         'suggestions': suggestions,
         'coaching_questions': coaching,
-        'tailored_resume_path': str(Path(args.out).resolve())
+        'tailored_resume_path': str(out_path.resolve())
     }
 
-    print(json.dumps(output, indent=2, ensure_ascii=False))
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+        sys.stdout.buffer.write(b'\n')
+    else:
+        json.dump(output, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write('\n')
 
 
 if __name__ == '__main__':
@@ -0,0 +1,23 @@
+"""Packaging for the resume coach helpers.
+
+Set RESUME_COACH_MYPYC=1 to compile `resume_coach.agent` with mypyc for
+batch workloads (requires `pip install mypy`). Without it the pure-Python
+modules are installed unchanged and behave identically.
+"""
+import os
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get('RESUME_COACH_MYPYC') == '1':
+    from mypyc.build import mypycify
+    ext_modules = mypycify(['resume_coach/agent.py'])
+
+setup(
+    name='resume-coach',
+    version='0.1.0',
+    packages=['resume_coach'],
+    python_requires='>=3.8',
+    install_requires=['requests'],
+    extras_require={'fast': ['orjson'], 'batch': ['aiohttp']},
+    ext_modules=ext_modules,
+)